@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from typing import Any, Callable
 
 from pydantic import BaseModel, Field
 
-from polytool.core.types import Message, Tool, Usage
+from polytool.core.types import Message, Tool, Usage, _FastMessage
 from polytool.core.exceptions import PolyToolError, ToolError
+from polytool.core.runner import run_sync
+from polytool.core.serialization import loads
 from polytool.tools.registry import ToolRegistry
 from polytool.tools.decorator import get_tool_from_func
 from polytool.providers.litellm import LiteLLMProvider
@@ -17,6 +18,10 @@ from polytool.codegen.executor import ExecuteCodeTool
 from polytool.codegen.prompts import build_system_prompt
 
 
+# Usage counter bumped per tool call; anything not listed counts as "tool_calls"
+_TOOL_CALL_COUNTER = {"execute_code": "ptc_executions"}
+
+
 class AgentResult(BaseModel):
     output: str
     usage: Usage = Field(default_factory=Usage)
@@ -26,7 +31,12 @@ class AgentResult(BaseModel):
 
 
 class Agent:
-    """Universal tool orchestration for LLMs."""
+    """
+    Universal tool orchestration for LLMs.
+    
+    Use as an async context manager (or call aclose()) to close the idle
+    E2B sandboxes kept warm for execute_code.
+    """
     
     def __init__(
         self,
@@ -46,6 +56,8 @@ class Agent:
         
         self.provider = LiteLLMProvider(model=model, **provider_kwargs)
         self.registry = ToolRegistry()
+        self._tools_cache: tuple[int, list[Tool]] | None = None
+        self._system_prompt_cache: tuple[str | None, int, str] | None = None
         
         if tools:
             for t in tools:
@@ -58,81 +70,153 @@ class Agent:
                     else:
                         raise ToolError(f"Function {t.__name__} is not decorated with @tool")
         
+        self._execute_code: ExecuteCodeTool | None = None
         if enable_ptc:
             self._execute_code = ExecuteCodeTool(self.registry, sandbox_type)
             self.registry.register(self._execute_code.get_tool())
     
+    async def __aenter__(self) -> "Agent":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Release resources held by the agent (idle warm sandboxes)."""
+        if self._execute_code is not None:
+            await self._execute_code.aclose()
+    
     async def run(self, prompt: str, *, messages: list[Message] | None = None) -> AgentResult:
         """Run the agent with a prompt."""
-        conversation = list(messages or [])
+        conversation: list[Message | _FastMessage] = list(messages or [])
+        tools = self._get_tools()
         
         if not conversation or conversation[0].role != "system":
-            tools = self.registry.get_all()
-            full_system = build_system_prompt(tools, self.system_prompt)
-            conversation.insert(0, Message(role="system", content=full_system))
+            conversation.insert(0, Message(role="system", content=self._get_system_prompt(tools)))
         
         conversation.append(Message(role="user", content=prompt))
         
         total_usage = Usage()
         tool_calls_made = 0
-        ptc_used = False
         
         for _ in range(self.max_iterations):
-            tools = self.registry.get_all()
+            tools = self._get_tools()
             response, usage = await self.provider.generate(conversation, tools)
             
-            total_usage.input_tokens += usage.input_tokens
-            total_usage.output_tokens += usage.output_tokens
-            total_usage.total_tokens += usage.total_tokens
+            total_usage.merge(usage)
             
             conversation.append(response)
             
             if not response.tool_calls:
-                return AgentResult(
+                return AgentResult.model_construct(
                     output=response.content or "",
                     usage=total_usage,
-                    messages=conversation,
+                    messages=_to_messages(conversation),
                     tool_calls_made=tool_calls_made,
-                    ptc_used=ptc_used,
+                    ptc_used=total_usage.ptc_executions > 0,
                 )
             
+            tool_calls_made += len(response.tool_calls)
             for tool_call in response.tool_calls:
-                tool_calls_made += 1
-                
-                func_name = tool_call["function"]["name"]
-                func_args = json.loads(tool_call["function"]["arguments"])
-                tool_call_id = tool_call["id"]
-                
-                if func_name == "execute_code":
-                    ptc_used = True
-                    total_usage.ptc_executions += 1
-                else:
-                    total_usage.tool_calls += 1
-                
-                try:
-                    result = await self.registry.execute(func_name, **func_args)
-                    result_str = str(result) if not isinstance(result, str) else result
-                except Exception as e:
-                    result_str = f"Error: {e}"
+                counter = _TOOL_CALL_COUNTER.get(tool_call["function"]["name"], "tool_calls")
+                setattr(total_usage, counter, getattr(total_usage, counter) + 1)
+            
+            # Run all tool calls from this turn concurrently; gather keeps order
+            results = await asyncio.gather(
+                *(self._run_tool_call(tc) for tc in response.tool_calls),
+                return_exceptions=True,
+            )
+            
+            for tool_call, result in zip(response.tool_calls, results):
+                if isinstance(result, BaseException):
+                    if not isinstance(result, Exception):
+                        raise result
+                    result = f"Error: {result}"
                 
-                conversation.append(Message(
+                conversation.append(_FastMessage(
                     role="tool",
-                    content=result_str,
-                    tool_call_id=tool_call_id,
-                    name=func_name,
+                    content=result,
+                    tool_call_id=tool_call["id"],
+                    name=tool_call["function"]["name"],
                 ))
         
-        return AgentResult(
+        return AgentResult.model_construct(
             output="[Max iterations reached]",
             usage=total_usage,
-            messages=conversation,
+            messages=_to_messages(conversation),
             tool_calls_made=tool_calls_made,
-            ptc_used=ptc_used,
+            ptc_used=total_usage.ptc_executions > 0,
         )
     
+    def _get_tools(self) -> list[Tool]:
+        """Get the registry's tools, re-fetching only after it changed."""
+        version = self.registry.version
+        cached = self._tools_cache
+        if cached is None or cached[0] != version:
+            cached = (version, self.registry.get_all())
+            self._tools_cache = cached
+        return cached[1]
+    
+    def _get_system_prompt(self, tools: list[Tool]) -> str:
+        """Build the system prompt once and reuse it until the tools change (or are edited)."""
+        version = self.registry.version
+        cached = self._system_prompt_cache
+        if cached is None or cached[0] != self.system_prompt or cached[1] != version:
+            cached = (self.system_prompt, version, build_system_prompt(tools, self.system_prompt))
+            self._system_prompt_cache = cached
+        return cached[2]
+    
+    async def _run_tool_call(self, tool_call: dict[str, Any]) -> str:
+        """Execute a single tool call and return its result as a string."""
+        func_name = tool_call["function"]["name"]
+        arguments = tool_call["function"]["arguments"]
+        # Arguments may arrive already decoded (e.g. replayed message history),
+        # and some providers send "" for tools without parameters
+        func_args = arguments if isinstance(arguments, dict) else loads(arguments or "{}")
+        
+        result = await self.registry.get_callable(func_name)(**func_args)
+        if type(result) is str:
+            return result
+        if isinstance(result, (bytes, bytearray)):
+            return result.decode("utf-8", "replace")
+        return str(result)
+    
     def run_sync(self, prompt: str, **kwargs: Any) -> AgentResult:
-        """Sync wrapper for run()."""
-        return asyncio.run(self.run(prompt, **kwargs))
+        """Sync wrapper for run(), executed on a shared background event loop."""
+        return run_sync(self.run(prompt, **kwargs))
+    
+    async def run_batch(
+        self,
+        prompts: list[str],
+        *,
+        max_concurrency: int = 16,
+        messages: list[Message] | None = None,
+    ) -> list[AgentResult]:
+        """
+        Run the agent on several prompts concurrently.
+        
+        The registry is treated as read-only while the batch is in flight;
+        don't add or remove tools until it returns.
+        
+        Args:
+            prompts: Prompts to run, each as an independent conversation
+            max_concurrency: Maximum number of runs in flight at once
+            messages: Optional history shared by every prompt
+        
+        Returns:
+            One AgentResult per prompt, in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run_one(prompt: str) -> AgentResult:
+            async with semaphore:
+                return await self.run(prompt, messages=messages)
+        
+        return await asyncio.gather(*(run_one(p) for p in prompts))
+    
+    def run_batch_sync(self, prompts: list[str], **kwargs: Any) -> list[AgentResult]:
+        """Sync wrapper for run_batch()."""
+        return run_sync(self.run_batch(prompts, **kwargs))
     
     def add_tool(self, tool: Tool | Callable[..., Any]) -> None:
         if isinstance(tool, Tool):
@@ -149,3 +233,8 @@ class Agent:
     @property
     def tools(self) -> list[Tool]:
         return self.registry.get_all()
+
+
+def _to_messages(conversation: list[Message | _FastMessage]) -> list[Message]:
+    """Convert internal fast messages to public Message objects."""
+    return [m.to_message() if isinstance(m, _FastMessage) else m for m in conversation]
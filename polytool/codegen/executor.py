@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import sys
 from typing import Any, TYPE_CHECKING
 
 from polytool.core.types import Tool, ToolSource, ExecutionResult
@@ -19,6 +21,9 @@ class ExecuteCodeTool:
     
     This tool allows the LLM to generate and execute Python code
     that orchestrates other tools in a sandbox.
+    
+    Each call enters its own sandbox; E2B sandboxes borrow a warm VM
+    from the process-wide pool. Call aclose() to close the idle VMs.
     """
     
     def __init__(
@@ -68,7 +73,6 @@ class ExecuteCodeTool:
         # Get all tools except execute_code itself
         tools = [t for t in self.registry.get_all() if t.name != "execute_code"]
         
-        # Get sandbox
         sandbox = get_sandbox(self.sandbox_type)
         
         async with sandbox:
@@ -85,10 +89,17 @@ class ExecuteCodeTool:
             )
         
         # Return stdout (this is what the LLM sees)
-        output = result.stdout.strip()
+        output = result.stdout
+        # Only pay for strip()'s copy when there is whitespace to remove
+        if output and (output[0].isspace() or output[-1].isspace()):
+            output = output.strip()
         if not output and result.return_value is not None:
             output = str(result.return_value)
         
         return output or "(no output)"
-
-
+    
+    async def aclose(self) -> None:
+        """Close the idle VMs of the process-wide E2B pool, if it was used."""
+        e2b = sys.modules.get("polytool.sandbox.e2b")
+        if e2b is not None:
+            await asyncio.to_thread(e2b.E2BSandbox.close_pool)
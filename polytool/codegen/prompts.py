@@ -27,30 +27,20 @@ print(f"Total lines: {total}")
 """
 
 
-def build_system_prompt(tools: list[Tool], base_prompt: str | None = None) -> str:
-    """Build system prompt with tool info."""
-    parts = []
-    
-    if base_prompt:
-        parts.append(base_prompt)
-    else:
-        parts.append("You are a helpful assistant with access to tools.")
-    
-    parts.append("""
+_TOOL_USAGE = """
 ## Tool Usage
 
 For simple tasks (1-2 tool calls), call tools directly.
 For complex tasks requiring multiple tools or data processing, use execute_code.
-""")
-    
-    parts.append("## Available Tools\n```python")
-    for tool in tools:
-        if tool.name == "execute_code":
-            continue
-        sig = tool.get_signature()
-        desc = tool.description.split("\n")[0]
-        parts.append(f'{sig}\n    """{desc}"""')
-        parts.append("")
-    parts.append("```")
-    
-    return "\n".join(parts)
+"""
+
+
+def build_system_prompt(tools: list[Tool], base_prompt: str | None = None) -> str:
+    """Build system prompt with tool info."""
+    base = base_prompt or "You are a helpful assistant with access to tools."
+    tool_block = "".join(
+        f'{tool.get_signature()}\n    """{tool.get_summary()}"""\n\n'
+        for tool in tools
+        if tool.name != "execute_code"
+    )
+    return f"{base}\n{_TOOL_USAGE}\n## Available Tools\n```python\n{tool_block}```"
@@ -21,6 +21,8 @@ class Settings(BaseSettings):
     default_model: str = "gpt-4o"
     default_temperature: float = 0.0
     default_max_tokens: int = 4096
+    # In-flight LLM requests per model (shared by all providers on a loop)
+    max_concurrent_requests: int = 32
     
     # Sandbox settings
     sandbox_type: Literal["e2b", "restricted", "docker"] = "e2b"
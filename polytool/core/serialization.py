@@ -0,0 +1,14 @@
+"""JSON helpers with an optional orjson fast path."""
+
+from __future__ import annotations
+
+import json
+
+# orjson is optional
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    loads = orjson.loads
+except ImportError:
+    ORJSON_AVAILABLE = False
+    loads = json.loads
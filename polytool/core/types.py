@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import inspect
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable, Awaitable
 from pydantic import BaseModel, Field
@@ -13,6 +15,16 @@ class ToolSource(str, Enum):
     LANGCHAIN = "langchain"
 
 
+# Bumped on every edit to any Tool's definition, so caches built from
+# several tools (registry views, system prompts) can tell they're stale
+_tool_edits = 0
+
+
+def tool_edit_count() -> int:
+    """Number of Tool definition edits so far in this process."""
+    return _tool_edits
+
+
 class Tool(BaseModel):
     name: str
     description: str
@@ -20,6 +32,10 @@ class Tool(BaseModel):
     source: ToolSource = ToolSource.NATIVE
     
     _executor: Callable[..., Awaitable[Any]] | Callable[..., Any] | None = None
+    _is_async: bool = False
+    _signature: str | None = None
+    _summary: str | None = None
+    _openai_schema: dict[str, Any] | None = None
     
     class Config:
         arbitrary_types_allowed = True
@@ -27,28 +43,67 @@ class Tool(BaseModel):
     def model_post_init(self, __context: Any) -> None:
         pass
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        global _tool_edits
+        super().__setattr__(name, value)
+        if name in ("name", "description", "parameters"):
+            self._invalidate_cache()
+            _tool_edits += 1
+    
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False) -> "Tool":
+        # update= writes fields directly, bypassing __setattr__
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._invalidate_cache()
+        return copied
+    
     async def execute(self, **kwargs: Any) -> Any:
         if self._executor is None:
             raise ValueError(f"Tool '{self.name}' has no executor")
+        if self._is_async:
+            return await self._executor(**kwargs)
         result = self._executor(**kwargs)
-        if hasattr(result, "__await__"):
+        # Sync callables may still hand back an awaitable (e.g. a lambda
+        # returning a coroutine)
+        if inspect.isawaitable(result):
             return await result
         return result
     
     def set_executor(self, executor: Callable[..., Any]) -> None:
         object.__setattr__(self, "_executor", executor)
+        object.__setattr__(self, "_is_async", inspect.iscoroutinefunction(executor))
+    
+    def _invalidate_cache(self) -> None:
+        """Drop derived schema/signature strings after the definition changes."""
+        object.__setattr__(self, "_signature", None)
+        object.__setattr__(self, "_summary", None)
+        object.__setattr__(self, "_openai_schema", None)
     
     def to_openai_schema(self) -> dict[str, Any]:
-        return {
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": self.parameters,
-            }
-        }
+        # Cached: the same dict is returned on every call, don't mutate it
+        if self._openai_schema is None:
+            object.__setattr__(self, "_openai_schema", {
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "description": self.description,
+                    "parameters": self.parameters,
+                }
+            })
+        return self._openai_schema
     
     def get_signature(self) -> str:
+        if self._signature is None:
+            object.__setattr__(self, "_signature", self._build_signature())
+        return self._signature
+    
+    def get_summary(self) -> str:
+        """First line of the description, as shown next to the signature."""
+        if self._summary is None:
+            object.__setattr__(self, "_summary", self.description.partition("\n")[0])
+        return self._summary
+    
+    def _build_signature(self) -> str:
         params = []
         properties = self.parameters.get("properties", {})
         required = set(self.parameters.get("required", []))
@@ -101,6 +156,19 @@ class Usage(BaseModel):
     execution_time_ms: float = 0
     estimated_direct_tokens: int | None = None
     
+    def merge(self, other: Usage) -> None:
+        """Add another Usage's counters into this one, in place."""
+        # Plain numeric sums, so skip pydantic's __setattr__
+        for counter in _USAGE_COUNTERS:
+            object.__setattr__(self, counter, getattr(self, counter) + getattr(other, counter))
+    
+    def to_array(self) -> Any:
+        """Get the integer counters as a numpy int64 array (see usage_agg)."""
+        import numpy as np
+        from polytool.core.usage_agg import usage_row
+        
+        return np.array(usage_row(self), dtype=np.int64)
+    
     @property
     def token_savings_percent(self) -> float | None:
         if self.estimated_direct_tokens is None or self.estimated_direct_tokens == 0:
@@ -109,9 +177,92 @@ class Usage(BaseModel):
         return round(savings * 100, 1)
 
 
+_USAGE_COUNTERS = (
+    "input_tokens",
+    "output_tokens",
+    "total_tokens",
+    "tool_calls",
+    "ptc_executions",
+    "estimated_cost_usd",
+    "execution_time_ms",
+)
+
+
 class Message(BaseModel):
     role: str
     content: str | None = None
     tool_calls: list[dict[str, Any]] | None = None
     tool_call_id: str | None = None
     name: str | None = None
+    
+    _dict: dict[str, Any] | None = None
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _MESSAGE_FIELDS:
+            object.__setattr__(self, "_dict", None)
+    
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False) -> "Message":
+        # update= writes fields directly, bypassing __setattr__
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            object.__setattr__(copied, "_dict", None)
+        return copied
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Chat-completions dict for this message (cached; don't mutate it)."""
+        if self._dict is None:
+            object.__setattr__(self, "_dict", _message_dict(self))
+        return self._dict
+
+
+_MESSAGE_FIELDS = frozenset(("role", "content", "tool_calls", "tool_call_id", "name"))
+
+
+def _message_dict(message: Message | _FastMessage) -> dict[str, Any]:
+    result: dict[str, Any] = {"role": message.role}
+    
+    if message.content is not None:
+        result["content"] = message.content
+    
+    if message.tool_calls:
+        result["tool_calls"] = message.tool_calls
+    
+    if message.tool_call_id:
+        result["tool_call_id"] = message.tool_call_id
+    
+    if message.name:
+        result["name"] = message.name
+    
+    return result
+
+
+@dataclass(slots=True)
+class _FastMessage:
+    """
+    Unvalidated Message stand-in for internal hot paths.
+    
+    Has the same attributes as Message; convert with to_message() before
+    handing it to callers.
+    """
+    role: str
+    content: str | None = None
+    tool_calls: list[dict[str, Any]] | None = None
+    tool_call_id: str | None = None
+    name: str | None = None
+    _dict: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Chat-completions dict for this message (cached; don't mutate it)."""
+        if self._dict is None:
+            self._dict = _message_dict(self)
+        return self._dict
+    
+    def to_message(self) -> Message:
+        return Message.model_construct(
+            role=self.role,
+            content=self.content,
+            tool_calls=self.tool_calls,
+            tool_call_id=self.tool_call_id,
+            name=self.name,
+        )
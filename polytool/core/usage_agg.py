@@ -0,0 +1,73 @@
+"""Bulk aggregation of Usage records (e.g. over batch evaluation results)."""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Sequence
+
+from polytool.core.types import Usage
+
+# Column order of Usage.to_array() / usages_to_array(); a missing
+# estimated_direct_tokens is stored as -1
+USAGE_ARRAY_FIELDS = (
+    "input_tokens",
+    "output_tokens",
+    "total_tokens",
+    "tool_calls",
+    "ptc_executions",
+    "estimated_direct_tokens",
+)
+
+_DIRECT = len(USAGE_ARRAY_FIELDS) - 1
+
+
+def usage_row(usage: Usage) -> tuple[int, ...]:
+    """Get a Usage's integer counters in USAGE_ARRAY_FIELDS order."""
+    direct = usage.estimated_direct_tokens
+    return (
+        usage.input_tokens,
+        usage.output_tokens,
+        usage.total_tokens,
+        usage.tool_calls,
+        usage.ptc_executions,
+        -1 if direct is None else direct,
+    )
+
+
+def usages_to_array(usages: Sequence[Usage]) -> Any:
+    """Pack usages into an int64 array of shape (N, 6). Requires numpy (the 'numpy' extra)."""
+    import numpy as np
+    
+    return np.array([usage_row(u) for u in usages], dtype=np.int64).reshape(-1, len(USAGE_ARRAY_FIELDS))
+
+
+def aggregate_usages(usages: Sequence[Usage]) -> Usage:
+    """
+    Sum a sequence of Usage records into one.
+    
+    estimated_direct_tokens is only summed when every record has it, so
+    the result's token_savings_percent compares like with like; otherwise
+    it is None.
+    """
+    sums = [0] * _DIRECT
+    direct = 0
+    direct_complete = bool(usages)
+    for usage in usages:
+        row = usage_row(usage)
+        for j in range(_DIRECT):
+            sums[j] += row[j]
+        if row[_DIRECT] < 0:
+            direct_complete = False
+        else:
+            direct += row[_DIRECT]
+    
+    return Usage(
+        input_tokens=sums[0],
+        output_tokens=sums[1],
+        total_tokens=sums[2],
+        tool_calls=sums[3],
+        ptc_executions=sums[4],
+        estimated_direct_tokens=direct if direct_complete else None,
+        estimated_cost_usd=math.fsum(u.estimated_cost_usd for u in usages),
+        execution_time_ms=math.fsum(u.execution_time_ms for u in usages),
+    )
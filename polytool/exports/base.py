@@ -2,19 +2,20 @@
 
 from __future__ import annotations
 
-import asyncio
-from typing import Any, Literal
+from typing import Any, Literal, TYPE_CHECKING
 
 from pydantic import BaseModel, Field
-from langchain_core.tools import BaseTool
-from langchain_core.callbacks import CallbackManagerForToolRun, AsyncCallbackManagerForToolRun
 
 from polytool.core.types import Tool, ToolSource
 from polytool.core.exceptions import SandboxError
+from polytool.core.runner import run_sync
 from polytool.sandbox.base import get_sandbox
 from polytool.tools.universal import normalize_tools
 from polytool.codegen.prompts import EXECUTE_CODE_DESCRIPTION
 
+if TYPE_CHECKING:
+    from langchain_core.tools import BaseTool
+
 
 class ExecuteCodeInput(BaseModel):
     code: str = Field(description="Python code to execute")
@@ -28,6 +29,17 @@ class ExecuteCodeExport:
         self.sandbox_type = sandbox_type
         self._langchain_tool: Any = None
     
+    @property
+    def tools(self) -> list[Tool]:
+        """Tools available to the code. Reassign (don't mutate) to change them."""
+        return self._tools
+    
+    @tools.setter
+    def tools(self, tools: list[Tool]) -> None:
+        self._tools = tools
+        self._description: str | None = None
+        self._openai_schema: dict[str, Any] | None = None
+    
     async def run(self, code: str) -> str:
         """Execute code in sandbox."""
         sandbox = get_sandbox(self.sandbox_type)
@@ -48,8 +60,8 @@ class ExecuteCodeExport:
         return output or "(no output)"
     
     def run_sync(self, code: str) -> str:
-        """Sync wrapper for run()."""
-        return asyncio.run(self.run(code))
+        """Sync wrapper for run(), executed on a shared background event loop."""
+        return run_sync(self.run(code))
     
     @property
     def schema(self) -> dict[str, Any]:
@@ -61,34 +73,38 @@ class ExecuteCodeExport:
     
     @property
     def description(self) -> str:
-        base = EXECUTE_CODE_DESCRIPTION
-        if self.tools:
-            sigs = []
-            for t in self.tools:
-                sig = t.get_signature()
-                desc = t.description.split("\n")[0]
-                sigs.append(f"{sig}\n    '''{desc}'''")
-            base += "\n\nAvailable tools:\n```python\n" + "\n\n".join(sigs) + "\n```"
-        return base
+        if self._description is None:
+            base = EXECUTE_CODE_DESCRIPTION
+            if self.tools:
+                sigs = "\n\n".join([
+                    f"{t.get_signature()}\n    '''{t.get_summary()}'''"
+                    for t in self.tools
+                ])
+                base += "\n\nAvailable tools:\n```python\n" + sigs + "\n```"
+            self._description = base
+        return self._description
     
     def as_openai_schema(self) -> dict[str, Any]:
-        return {
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "code": {
-                            "type": "string",
-                            "description": "Python code to execute. Use await for tool calls.",
+        # Built once and shared between calls; treat as read-only
+        if self._openai_schema is None:
+            self._openai_schema = {
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "description": self.description,
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "code": {
+                                "type": "string",
+                                "description": "Python code to execute. Use await for tool calls.",
+                            },
                         },
+                        "required": ["code"],
                     },
-                    "required": ["code"],
                 },
-            },
-        }
+            }
+        return self._openai_schema
     
     def as_litellm_tool(self) -> dict[str, Any]:
         return self.as_openai_schema()
@@ -117,6 +133,9 @@ class ExecuteCodeExport:
 
 
 def _create_langchain_tool(export: ExecuteCodeExport) -> BaseTool:
+    from langchain_core.tools import BaseTool
+    from langchain_core.callbacks import CallbackManagerForToolRun, AsyncCallbackManagerForToolRun
+    
     class PolyToolExecuteCode(BaseTool):
         name: str = "execute_code"
         description: str = export.description
@@ -2,16 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import weakref
 from typing import Any, AsyncIterator
 
-import litellm
-from litellm import acompletion
-
-from polytool.core.types import Message, Tool, Usage
+from polytool.core.types import Message, Tool, Usage, _FastMessage
 from polytool.core.config import get_settings
 from polytool.core.exceptions import ProviderError
 
+# One semaphore per (model, limit) per event loop (asyncio primitives are
+# loop-bound); providers sharing a model and limit share the budget
+_semaphores: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[str, int], asyncio.Semaphore]
+] = weakref.WeakKeyDictionary()
+
+
+def _get_semaphore(model: str, limit: int) -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    per_loop = _semaphores.get(loop)
+    if per_loop is None:
+        per_loop = _semaphores[loop] = {}
+    key = (model, limit)
+    semaphore = per_loop.get(key)
+    if semaphore is None:
+        semaphore = per_loop[key] = asyncio.Semaphore(limit)
+    return semaphore
+
 
 class LiteLLMProvider:
     """
@@ -26,19 +43,25 @@ class LiteLLMProvider:
         temperature: float | None = None,
         max_tokens: int | None = None,
         api_key: str | None = None,
+        max_concurrent_requests: int | None = None,
         **kwargs: Any,
     ):
+        # litellm takes seconds to import; defer it until a provider is built
+        from litellm import acompletion
+        self._acompletion = acompletion
+        
         settings = get_settings()
         
         self.model = model or settings.default_model
         self.temperature = temperature if temperature is not None else settings.default_temperature
         self.max_tokens = max_tokens or settings.default_max_tokens
+        # In-flight request limit, shared with providers for the same model
+        # and limit
+        self.max_concurrent_requests = max_concurrent_requests or settings.max_concurrent_requests
         self.extra_kwargs = kwargs
-        
-        # Set API key if provided
-        if api_key:
-            # LiteLLM will pick this up based on model prefix
-            litellm.api_key = api_key
+        # Passed per request rather than set on the litellm module, so
+        # providers with different keys don't overwrite each other
+        self.api_key = api_key
     
     async def generate(
         self,
@@ -58,7 +81,7 @@ class LiteLLMProvider:
             Tuple of (assistant message, usage stats)
         """
         # Convert messages to LiteLLM format
-        litellm_messages = [self._message_to_dict(m) for m in messages]
+        litellm_messages = [m.to_dict() for m in messages]
         
         # Convert tools to OpenAI format
         litellm_tools = None
@@ -66,14 +89,15 @@ class LiteLLMProvider:
             litellm_tools = [t.to_openai_schema() for t in tools]
         
         try:
-            response = await acompletion(
-                model=self.model,
-                messages=litellm_messages,
-                tools=litellm_tools,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                **{**self.extra_kwargs, **kwargs},
-            )
+            async with _get_semaphore(self.model, self.max_concurrent_requests):
+                response = await self._acompletion(
+                    model=self.model,
+                    messages=litellm_messages,
+                    tools=litellm_tools,
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                    **{"api_key": self.api_key, **self.extra_kwargs, **kwargs},
+                )
             
             # Extract response
             choice = response.choices[0]
@@ -95,6 +119,31 @@ class LiteLLMProvider:
                 model=self.model,
             ) from e
     
+    async def generate_many(
+        self,
+        batch: list[list[Message]],
+        tools: list[Tool] | None = None,
+        **kwargs: Any,
+    ) -> list[tuple[Message, Usage]]:
+        """
+        Generate responses for several conversations concurrently.
+        
+        Requests are issued together and throttled by the per-model
+        max_concurrent_requests limit.
+        
+        Args:
+            batch: One message history per request
+            tools: Available tools for function calling (shared)
+            **kwargs: Additional LiteLLM options
+        
+        Returns:
+            One (assistant message, usage stats) tuple per conversation,
+            in input order
+        """
+        return list(await asyncio.gather(
+            *(self.generate(messages, tools, **kwargs) for messages in batch)
+        ))
+    
     async def generate_stream(
         self,
         messages: list[Message],
@@ -102,23 +151,37 @@ class LiteLLMProvider:
         **kwargs: Any,
     ) -> AsyncIterator[str]:
         """Stream a response from the LLM."""
-        litellm_messages = [self._message_to_dict(m) for m in messages]
+        litellm_messages = [m.to_dict() for m in messages]
         litellm_tools = [t.to_openai_schema() for t in tools] if tools else None
         
         try:
-            response = await acompletion(
-                model=self.model,
-                messages=litellm_messages,
-                tools=litellm_tools,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                stream=True,
-                **{**self.extra_kwargs, **kwargs},
-            )
+            semaphore = _get_semaphore(self.model, self.max_concurrent_requests)
+            async with semaphore:
+                response = await self._acompletion(
+                    model=self.model,
+                    messages=litellm_messages,
+                    tools=litellm_tools,
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                    stream=True,
+                    **{"api_key": self.api_key, **self.extra_kwargs, **kwargs},
+                )
             
-            async for chunk in response:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
+            chunks = response.__aiter__()
+            while True:
+                # A slot is held only while reading from the network, never
+                # across yield: the consumer may itself call generate(), and
+                # an abandoned stream mustn't keep its slot
+                async with semaphore:
+                    try:
+                        chunk = await chunks.__anext__()
+                    except StopAsyncIteration:
+                        break
+                choices = chunk.choices
+                if choices:
+                    content = choices[0].delta.content
+                    if content:
+                        yield content
         
         except Exception as e:
             raise ProviderError(
@@ -127,36 +190,28 @@ class LiteLLMProvider:
                 model=self.model,
             ) from e
     
-    def _message_to_dict(self, message: Message) -> dict[str, Any]:
+    def _message_to_dict(self, message: Message | _FastMessage) -> dict[str, Any]:
         """Convert Message to LiteLLM dict format."""
-        result: dict[str, Any] = {"role": message.role}
-        
-        if message.content is not None:
-            result["content"] = message.content
-        
-        if message.tool_calls:
-            result["tool_calls"] = message.tool_calls
-        
-        if message.tool_call_id:
-            result["tool_call_id"] = message.tool_call_id
-        
-        if message.name:
-            result["name"] = message.name
-        
-        return result
+        return message.to_dict()
     
     def _response_to_message(self, response_message: Any) -> Message:
         """Convert LiteLLM response to Message."""
         tool_calls = None
-        if hasattr(response_message, "tool_calls") and response_message.tool_calls:
+        response_tool_calls = getattr(response_message, "tool_calls", None)
+        if response_tool_calls:
             tool_calls = []
-            for tc in response_message.tool_calls:
+            for tc in response_tool_calls:
+                if isinstance(tc, dict):
+                    # Already in OpenAI wire format
+                    tool_calls.append(tc)
+                    continue
+                function = tc.function
                 tool_calls.append({
                     "id": tc.id,
                     "type": "function",
                     "function": {
-                        "name": tc.function.name,
-                        "arguments": tc.function.arguments,
+                        "name": function.name,
+                        "arguments": function.arguments,
                     }
                 })
         
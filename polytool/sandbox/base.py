@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Protocol, TYPE_CHECKING
 
 from polytool.core.types import ExecutionResult, Tool
@@ -19,6 +20,7 @@ class Sandbox(Protocol):
         code: str,
         tools: list[Tool] | None = None,
         timeout: float | None = None,
+        capture_output: bool = True,
     ) -> ExecutionResult:
         """
         Execute code in the sandbox.
@@ -27,6 +29,8 @@ class Sandbox(Protocol):
             code: Python code to execute
             tools: Tools to make available in the sandbox
             timeout: Execution timeout in seconds
+            capture_output: Collect stdout/stderr into the result; pass False
+                when only the return value is needed
         
         Returns:
             ExecutionResult with stdout, stderr, and return value
@@ -54,19 +58,24 @@ def get_sandbox(sandbox_type: str | None = None) -> Sandbox:
     """
     settings = get_settings()
     stype = sandbox_type or settings.sandbox_type
-    
+    return _resolve_sandbox_cls(stype)()
+
+
+@lru_cache(maxsize=None)
+def _resolve_sandbox_cls(stype: str) -> type[Sandbox]:
+    """Map a sandbox type to its class; imports happen once per type."""
     if stype == "e2b":
         try:
             from polytool.sandbox.e2b import E2BSandbox
-            return E2BSandbox()
+            return E2BSandbox
         except ImportError:
             # Fall back to restricted if E2B not installed
             from polytool.sandbox.restricted import RestrictedSandbox
-            return RestrictedSandbox()
+            return RestrictedSandbox
     
     elif stype == "restricted":
         from polytool.sandbox.restricted import RestrictedSandbox
-        return RestrictedSandbox()
+        return RestrictedSandbox
     
     elif stype == "docker":
         raise NotImplementedError("Docker sandbox not yet implemented")
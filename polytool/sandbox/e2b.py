@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
+import ast
+import asyncio
+import atexit
 import json
+import threading
 import time
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from operator import attrgetter
+from typing import Any, Callable, TypeVar
 
 from polytool.core.types import ExecutionResult, Tool
 from polytool.core.config import get_settings
@@ -19,12 +27,114 @@ except ImportError:
     E2BSandboxBase = None  # type: ignore
 
 
+T = TypeVar("T")
+
+_get_line = attrgetter("line")
+
+# The E2B SDK is blocking; run it on its own threads so concurrent
+# executions overlap without starving the default executor
+_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="polytool-e2b")
+
+
+async def _run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, partial(func, *args, **kwargs))
+
+
+@dataclass(slots=True)
+class _PoolEntry:
+    sandbox: Any
+    api_key: str | None
+    created_at: float = 0.0
+    last_used: float = 0.0
+    broken: bool = False
+    # Code context (kernel) of the current borrower; discarded on return
+    context: Any = None
+    # (name, description) pairs whose wrappers are already defined in context
+    tools_key: tuple[tuple[str, str], ...] | None = None
+
+
+# Process-wide pool of warm sandboxes, newest last (LIFO)
+_pool: list[_PoolEntry] = []
+_pool_lock = threading.Lock()
+_pool_max_size = 4
+_pool_idle_ttl = 120.0
+# E2B kills a VM a fixed time after creation (5 minutes by default),
+# however recently it was used
+_pool_max_age = 240.0
+
+
+def _close_quietly(entry: _PoolEntry) -> None:
+    try:
+        entry.sandbox.close()
+    except Exception:
+        pass
+
+
+def _is_expired(entry: _PoolEntry, now: float) -> bool:
+    return (
+        now - entry.last_used > _pool_idle_ttl
+        or now - entry.created_at > _pool_max_age
+    )
+
+
+def _is_alive(sandbox: Any) -> bool:
+    """Whether the VM still exists; any failure to tell counts as gone."""
+    try:
+        return bool(sandbox.is_running())
+    except Exception:
+        return False
+
+
+def _take_from_pool(api_key: str | None) -> _PoolEntry | None:
+    """Pop the most recently used idle sandbox for api_key, reaping expired ones."""
+    now = time.monotonic()
+    entry = None
+    with _pool_lock:
+        expired = [e for e in _pool if _is_expired(e, now)]
+        _pool[:] = [e for e in _pool if not _is_expired(e, now)]
+        for i in range(len(_pool) - 1, -1, -1):
+            if _pool[i].api_key == api_key:
+                entry = _pool.pop(i)
+                break
+    for e in expired:
+        _close_quietly(e)
+    return entry
+
+
+def _discard_context(entry: _PoolEntry) -> None:
+    """Drop the borrower's interpreter state; a VM that can't is marked broken."""
+    context, entry.context, entry.tools_key = entry.context, None, None
+    try:
+        entry.sandbox.remove_code_context(context)
+    except Exception:
+        entry.broken = True
+
+
+def _return_to_pool(entry: _PoolEntry) -> None:
+    """Put a sandbox back for reuse, or close it if broken or the pool is full."""
+    if not entry.broken:
+        _discard_context(entry)
+    if not entry.broken:
+        entry.last_used = time.monotonic()
+        with _pool_lock:
+            if len(_pool) < _pool_max_size:
+                _pool.append(entry)
+                return
+    _close_quietly(entry)
+
+
 class E2BSandbox:
     """
     Cloud sandbox using E2B Code Interpreter.
     
     Provides secure, isolated code execution in cloud VMs.
     Recommended for production use.
+    
+    VMs are drawn from a process-wide pool of warm sandboxes and returned
+    to it afterwards instead of being closed. Each borrower gets a fresh
+    code context, discarded on return, so variables never reach the next
+    borrower; files written to the VM's disk do. See configure_pool().
     """
     
     def __init__(self, timeout: float | None = None, api_key: str | None = None):
@@ -36,24 +146,109 @@ class E2BSandbox:
         settings = get_settings()
         self.timeout = timeout or settings.sandbox_timeout_seconds
         self.api_key = api_key or settings.e2b_api_key
-        self._sandbox: Any = None
+        self._entry: _PoolEntry | None = None
+        self._in_context = False
+    
+    @staticmethod
+    def configure_pool(
+        max_size: int = 4,
+        idle_ttl: float = 120.0,
+        max_age: float = 240.0,
+    ) -> None:
+        """
+        Configure the process-wide warm sandbox pool.
+        
+        Args:
+            max_size: Maximum idle sandboxes kept (0 disables pooling)
+            idle_ttl: Seconds an idle sandbox is kept before being closed
+            max_age: Seconds after creation a sandbox is no longer reused;
+                keep this below the E2B sandbox lifetime
+        """
+        global _pool_max_size, _pool_idle_ttl, _pool_max_age
+        with _pool_lock:
+            _pool_max_size = max_size
+            _pool_idle_ttl = idle_ttl
+            _pool_max_age = max_age
+            excess = _pool[:max(len(_pool) - max_size, 0)]
+            del _pool[:len(excess)]
+        for entry in excess:
+            _close_quietly(entry)
+    
+    @staticmethod
+    def close_pool() -> None:
+        """
+        Close every idle sandbox in the process-wide pool.
+        
+        Sandboxes in use are unaffected and are pooled again when released.
+        Also runs at interpreter exit.
+        """
+        with _pool_lock:
+            entries = _pool[:]
+            _pool.clear()
+        for entry in entries:
+            _close_quietly(entry)
     
     async def __aenter__(self) -> "E2BSandbox":
-        """Create and enter the sandbox."""
-        self._sandbox = E2BSandboxBase(api_key=self.api_key)
+        """Take a sandbox from the pool (or create one) and enter it."""
+        self._entry = await self._acquire()
+        self._in_context = True
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Close the sandbox."""
-        if self._sandbox:
-            self._sandbox.close()
-            self._sandbox = None
+        """Return the sandbox to the pool."""
+        self._in_context = False
+        if self._entry:
+            if exc_type is not None:
+                self._entry.broken = True
+            entry, self._entry = self._entry, None
+            await _run_blocking(_return_to_pool, entry)
+    
+    async def _acquire(self, fresh: bool = False) -> _PoolEntry:
+        """A VM with a fresh code context: pooled if one is idle, else new."""
+        entry = None if fresh else await _run_blocking(_take_from_pool, self.api_key)
+        if entry is not None:
+            try:
+                entry.context = await _run_blocking(entry.sandbox.create_code_context)
+                return entry
+            except Exception:
+                # Most likely expired while idle
+                await _run_blocking(_close_quietly, entry)
+        
+        sandbox = await _run_blocking(E2BSandboxBase, api_key=self.api_key)
+        entry = _PoolEntry(
+            sandbox=sandbox, api_key=self.api_key, created_at=time.monotonic()
+        )
+        try:
+            entry.context = await _run_blocking(sandbox.create_code_context)
+        except BaseException:
+            await _run_blocking(_close_quietly, entry)
+            raise
+        return entry
+    
+    async def _checkout(self, fresh: bool = False) -> _PoolEntry:
+        """The VM for one execution: the context's own, or one borrowed from the pool."""
+        if not self._in_context:
+            return await self._acquire(fresh)
+        if self._entry is None:
+            self._entry = await self._acquire(fresh)
+        return self._entry
+    
+    async def _checkin(self, entry: _PoolEntry) -> None:
+        """Give back a VM after an execution; broken ones are closed."""
+        if self._in_context:
+            if not entry.broken:
+                return
+            # Replaced with a new VM on the next execution
+            if self._entry is entry:
+                self._entry = None
+        await _run_blocking(_return_to_pool, entry)
     
     async def execute(
         self,
         code: str,
         tools: list[Tool] | None = None,
         timeout: float | None = None,
+        capture_output: bool = True,
     ) -> ExecutionResult:
         """
         Execute code in the E2B sandbox.
@@ -62,82 +257,119 @@ class E2BSandbox:
             code: Python code to execute
             tools: Tools to make available (injected as callable functions)
             timeout: Execution timeout
+            capture_output: Collect stdout/stderr logs into the result
         
         Returns:
             ExecutionResult with stdout and results
         """
         timeout = timeout or self.timeout
         start_time = time.time()
+        call_start = time.monotonic()
         
-        # Create sandbox if not in context
-        sandbox = self._sandbox
-        own_sandbox = False
-        if sandbox is None:
-            sandbox = E2BSandboxBase(api_key=self.api_key)
-            own_sandbox = True
-        
+        entry: _PoolEntry | None = await self._checkout()
         try:
-            # If we have tools, we need to inject them
-            # This is done by generating wrapper code
-            if tools:
-                wrapper_code = self._generate_tool_wrappers(tools)
-                full_code = f"{wrapper_code}\n\n{code}"
-            else:
-                full_code = code
-            
-            # Execute in sandbox
-            execution = sandbox.run_code(full_code, timeout=timeout)
-            
-            # Extract results
-            stdout = ""
-            stderr = ""
-            
-            if execution.logs:
-                stdout = "\n".join(
-                    line.line for line in (execution.logs.stdout or [])
-                )
-                stderr = "\n".join(
-                    line.line for line in (execution.logs.stderr or [])
+            try:
+                return await self._run(entry, code, tools, timeout, capture_output, start_time)
+            except Exception as e:
+                # The VM may be gone (e.g. past its lifetime); don't reuse it
+                entry.broken = True
+                error = e
+                # A VM that predates this call may have expired since its
+                # last use; retry once on a new one. A fresh VM's error is real.
+                retry = entry.created_at < call_start and not await _run_blocking(
+                    _is_alive, entry.sandbox
                 )
+            if not retry:
+                return _error_result(error, start_time)
             
-            # Check for errors
-            if execution.error:
-                return ExecutionResult(
-                    success=False,
-                    stdout=stdout,
-                    stderr=stderr,
-                    error=f"{execution.error.name}: {execution.error.value}",
-                    execution_time_ms=(time.time() - start_time) * 1000,
+            old, entry = entry, None
+            await self._checkin(old)
+            entry = await self._checkout(fresh=True)
+            try:
+                return await self._run(entry, code, tools, timeout, capture_output, start_time)
+            except Exception as e:
+                entry.broken = True
+                return _error_result(e, start_time)
+        
+        finally:
+            if entry is not None:
+                await self._checkin(entry)
+    
+    async def _run(
+        self,
+        entry: _PoolEntry,
+        code: str,
+        tools: list[Tool] | None,
+        timeout: float,
+        capture_output: bool,
+        start_time: float,
+    ) -> ExecutionResult:
+        """Run code on one VM; SDK errors propagate to execute()."""
+        sandbox = entry.sandbox
+        
+        # If we have tools, we need to inject them
+        # This is done by running generated wrapper code, once per code
+        # context and tool set (definitions persist in the context)
+        if tools:
+            tools_key = tuple((t.name, t.description) for t in tools)
+            if entry.tools_key != tools_key:
+                setup = await _run_blocking(
+                    sandbox.run_code,
+                    _tool_wrapper_code(tools_key),
+                    context=entry.context,
+                    timeout=timeout,
                 )
-            
-            # Get return value from results
-            return_value = None
-            if execution.results:
-                # Take the last result
-                last_result = execution.results[-1]
-                if hasattr(last_result, "text"):
-                    return_value = last_result.text
-                elif hasattr(last_result, "data"):
-                    return_value = last_result.data
-            
+                if setup.error:
+                    return ExecutionResult(
+                        success=False,
+                        error=f"{setup.error.name}: {setup.error.value}",
+                        execution_time_ms=(time.time() - start_time) * 1000,
+                    )
+                entry.tools_key = tools_key
+        
+        # Execute in sandbox
+        execution = await _run_blocking(
+            sandbox.run_code, code, context=entry.context, timeout=timeout
+        )
+        if entry.tools_key and _rebinds_tool(code, entry.tools_key):
+            # The code may have replaced a wrapper; define them again next time
+            entry.tools_key = None
+        
+        # Extract results
+        stdout = ""
+        stderr = ""
+        
+        if capture_output and execution.logs:
+            stdout = "\n".join(map(_get_line, execution.logs.stdout or ()))
+            stderr = "\n".join(map(_get_line, execution.logs.stderr or ()))
+        
+        # Check for errors
+        if execution.error:
             return ExecutionResult(
-                success=True,
+                success=False,
                 stdout=stdout,
                 stderr=stderr,
-                return_value=return_value,
+                error=f"{execution.error.name}: {execution.error.value}",
                 execution_time_ms=(time.time() - start_time) * 1000,
             )
         
-        except Exception as e:
-            return ExecutionResult(
-                success=False,
-                error=f"E2B error: {e}",
-                execution_time_ms=(time.time() - start_time) * 1000,
-            )
+        # Get return value from results
+        return_value = None
+        if execution.results:
+            # Take the last result
+            last_result = execution.results[-1]
+            if hasattr(last_result, "text"):
+                return_value = last_result.text
+            elif hasattr(last_result, "data"):
+                return_value = last_result.data
         
-        finally:
-            if own_sandbox and sandbox:
-                sandbox.close()
+        return ExecutionResult(
+            success=True,
+            stdout=stdout,
+            stderr=stderr,
+            return_value=return_value,
+            execution_time_ms=(time.time() - start_time) * 1000,
+        )
     
     def _generate_tool_wrappers(self, tools: list[Tool]) -> str:
         """
@@ -151,23 +383,62 @@ class E2BSandbox:
         For now, this creates placeholder functions that print
         what would be called.
         """
-        lines = [
-            "# Tool wrappers (placeholder implementation)",
-            "import json",
-            "",
-        ]
-        
-        for tool in tools:
-            # Generate a simple wrapper that shows the call
-            # In production, this would make HTTP calls back
-            lines.append(f"async def {tool.name}(**kwargs):")
-            lines.append(f'    """')
-            lines.append(f"    {tool.description}")
-            lines.append(f'    """')
-            lines.append(f"    print(f'[TOOL CALL] {tool.name}({{kwargs}})')")
-            lines.append(f"    return f'Result of {tool.name}'")
-            lines.append("")
-        
-        return "\n".join(lines)
+        return _tool_wrapper_code(tuple((t.name, t.description) for t in tools))
+
+
+# Idle VMs keep running (and billing) until closed
+atexit.register(E2BSandbox.close_pool)
+
+
+def _rebinds_tool(code: str, tools_key: tuple[tuple[str, str], ...]) -> bool:
+    """Whether code may assign, define, import or delete a tool's name."""
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return False
+    names = {name for name, _ in tools_key}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and not isinstance(node.ctx, ast.Load):
+            bound = node.id
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            bound = node.name
+        elif isinstance(node, ast.alias):
+            if node.name == "*":
+                return True
+            bound = node.asname or node.name.partition(".")[0]
+        else:
+            continue
+        if bound in names:
+            return True
+    return False
+
+
+def _error_result(error: Exception, start_time: float) -> ExecutionResult:
+    return ExecutionResult(
+        success=False,
+        error=f"E2B error: {error}",
+        execution_time_ms=(time.time() - start_time) * 1000,
+    )
+
+
+_TOOL_WRAPPERS_HEADER = "# Tool wrappers (placeholder implementation)\nimport json\n"
+
+# Generates a simple wrapper that shows the call; in production this would
+# make HTTP calls back
+_TOOL_WRAPPER_TEMPLATE = """
+async def {name}(**kwargs):
+    \"\"\"
+    {description}
+    \"\"\"
+    print(f'[TOOL CALL] {name}({{kwargs}})')
+    return f'Result of {name}'
+"""
 
 
+@lru_cache(maxsize=64)
+def _tool_wrapper_code(specs: tuple[tuple[str, str], ...]) -> str:
+    """Render wrapper source for (name, description) pairs; cached per tool set."""
+    return _TOOL_WRAPPERS_HEADER + "".join(
+        _TOOL_WRAPPER_TEMPLATE.format(name=name, description=description)
+        for name, description in specs
+    )
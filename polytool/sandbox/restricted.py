@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-import ast
 import asyncio
+import json
 import sys
 import time
+import weakref
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from functools import lru_cache
 from io import StringIO
-from typing import Any
+from types import CodeType
+from typing import Any, Callable, Iterable, Iterator, TextIO
 
 from polytool.core.types import ExecutionResult, Tool
 from polytool.core.config import get_settings
@@ -42,6 +47,7 @@ class RestrictedSandbox:
         code: str,
         tools: list[Tool] | None = None,
         timeout: float | None = None,
+        capture_output: bool = True,
     ) -> ExecutionResult:
         """
         Execute code in the restricted sandbox.
@@ -50,6 +56,8 @@ class RestrictedSandbox:
             code: Python code to execute
             tools: Tools to make available
             timeout: Execution timeout
+            capture_output: Redirect stdout/stderr into the result; when
+                False, print() goes straight to the process streams
         
         Returns:
             ExecutionResult with stdout and any errors
@@ -57,13 +65,15 @@ class RestrictedSandbox:
         timeout = timeout or self.timeout
         start_time = time.time()
         
-        # Validate syntax
+        # Compile once; this doubles as the syntax check
         try:
-            ast.parse(code)
+            compiled = _compile_wrapped(code)
         except SyntaxError as e:
+            # Report line numbers relative to the user's code, not the wrapper
+            line = f" (line {max(e.lineno - 1, 1)})" if e.lineno else ""
             return ExecutionResult(
                 success=False,
-                error=f"Syntax error: {e}",
+                error=f"Syntax error: {e.msg}{line}",
                 execution_time_ms=(time.time() - start_time) * 1000,
             )
         
@@ -73,19 +83,19 @@ class RestrictedSandbox:
         # Capture stdout/stderr
         stdout_capture = StringIO()
         stderr_capture = StringIO()
-        
-        old_stdout = sys.stdout
-        old_stderr = sys.stderr
+        redirect = (
+            _redirect_output(stdout_capture, stderr_capture)
+            if capture_output
+            else nullcontext()
+        )
         
         try:
-            sys.stdout = stdout_capture
-            sys.stderr = stderr_capture
-            
-            # Execute with timeout
-            result = await asyncio.wait_for(
-                self._execute_code(code, namespace),
-                timeout=timeout,
-            )
+            with redirect:
+                # Execute with timeout
+                result = await asyncio.wait_for(
+                    self._execute_code(compiled, namespace),
+                    timeout=timeout,
+                )
             
             return ExecutionResult(
                 success=True,
@@ -112,22 +122,11 @@ class RestrictedSandbox:
                 error=f"{type(e).__name__}: {e}",
                 execution_time_ms=(time.time() - start_time) * 1000,
             )
-        
-        finally:
-            sys.stdout = old_stdout
-            sys.stderr = old_stderr
     
-    async def _execute_code(self, code: str, namespace: dict[str, Any]) -> Any:
+    async def _execute_code(self, compiled: CodeType, namespace: dict[str, Any]) -> Any:
         """Execute code and return result."""
-        # Wrap code in async function to support await
-        # Add a pass statement in case the code is empty or has trailing newlines
-        indented = _indent(code.rstrip(), 4)
-        if not indented.strip():
-            indented = "    pass"
-        wrapped_code = f"async def __polytool_main__():\n{indented}\n    pass\n"
-        
-        # Compile and exec to define the function
-        exec(compile(wrapped_code, "<sandbox>", "exec"), namespace)
+        # Define the wrapper function from the compiled code object
+        exec(compiled, namespace)
         
         # Get the function and await it
         main_func = namespace["__polytool_main__"]
@@ -135,40 +134,7 @@ class RestrictedSandbox:
     
     def _build_namespace(self, tools: list[Tool]) -> dict[str, Any]:
         """Build execution namespace with tools and safe builtins."""
-        namespace: dict[str, Any] = {
-            # Safe builtins
-            "print": print,
-            "len": len,
-            "range": range,
-            "enumerate": enumerate,
-            "zip": zip,
-            "map": map,
-            "filter": filter,
-            "sorted": sorted,
-            "reversed": reversed,
-            "list": list,
-            "dict": dict,
-            "set": set,
-            "tuple": tuple,
-            "str": str,
-            "int": int,
-            "float": float,
-            "bool": bool,
-            "sum": sum,
-            "min": min,
-            "max": max,
-            "abs": abs,
-            "round": round,
-            "any": any,
-            "all": all,
-            "isinstance": isinstance,
-            "hasattr": hasattr,
-            "getattr": getattr,
-            "setattr": setattr,
-            # Common imports
-            "json": __import__("json"),
-            "asyncio": asyncio,
-        }
+        namespace = _BASE_NAMESPACE.copy()
         
         # Add tools as async functions
         for tool in tools:
@@ -177,14 +143,137 @@ class RestrictedSandbox:
         return namespace
     
     def _make_tool_wrapper(self, tool: Tool):
-        """Create an async wrapper for a tool."""
-        async def wrapper(**kwargs):
-            return await tool.execute(**kwargs)
-        wrapper.__name__ = tool.name
-        wrapper.__doc__ = tool.description
+        """Get the (cached) async wrapper for a tool."""
+        key = id(tool)
+        wrapper = _tool_wrappers.get(key)
+        if wrapper is None:
+            wrapper = _tool_wrappers[key] = _make_tool_wrapper(tool)
+            # Drop the entry with the tool so a recycled id can't hit it
+            weakref.finalize(tool, _tool_wrappers.pop, key, None)
         return wrapper
 
 
+class _ContextualStream:
+    """
+    Stand-in for sys.stdout/sys.stderr that writes to the current context's
+    buffer, or to the original stream when none is set.
+    
+    Lets concurrent executions capture their own output without swapping
+    the process-wide stream per call.
+    """
+    
+    def __init__(self, var: ContextVar[TextIO | None], fallback: TextIO):
+        self._var = var
+        self._fallback = fallback
+    
+    def _target(self) -> TextIO:
+        return self._var.get() or self._fallback
+    
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+    
+    def writelines(self, lines: Iterable[str]) -> None:
+        self._target().writelines(lines)
+    
+    def flush(self) -> None:
+        self._target().flush()
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target(), name)
+
+
+_stdout_var: ContextVar[TextIO | None] = ContextVar("polytool_stdout", default=None)
+_stderr_var: ContextVar[TextIO | None] = ContextVar("polytool_stderr", default=None)
+
+
+def _install_streams() -> None:
+    """Put the contextual proxies on sys (again, if something replaced them)."""
+    if not isinstance(sys.stdout, _ContextualStream):
+        sys.stdout = _ContextualStream(_stdout_var, sys.stdout)
+    if not isinstance(sys.stderr, _ContextualStream):
+        sys.stderr = _ContextualStream(_stderr_var, sys.stderr)
+
+
+@contextmanager
+def _redirect_output(stdout: StringIO, stderr: StringIO) -> Iterator[None]:
+    _install_streams()
+    # Tasks started inside (wait_for, gather) copy this context
+    stdout_token = _stdout_var.set(stdout)
+    stderr_token = _stderr_var.set(stderr)
+    try:
+        yield
+    finally:
+        _stderr_var.reset(stderr_token)
+        _stdout_var.reset(stdout_token)
+
+
+# Safe builtins and common imports, copied into every execution namespace
+_BASE_NAMESPACE: dict[str, Any] = {
+    # Safe builtins
+    "print": print,
+    "len": len,
+    "range": range,
+    "enumerate": enumerate,
+    "zip": zip,
+    "map": map,
+    "filter": filter,
+    "sorted": sorted,
+    "reversed": reversed,
+    "list": list,
+    "dict": dict,
+    "set": set,
+    "tuple": tuple,
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "sum": sum,
+    "min": min,
+    "max": max,
+    "abs": abs,
+    "round": round,
+    "any": any,
+    "all": all,
+    "isinstance": isinstance,
+    "hasattr": hasattr,
+    "getattr": getattr,
+    "setattr": setattr,
+    # Common imports
+    "json": json,
+    "asyncio": asyncio,
+}
+
+# Tool wrappers keyed by id(tool); entries are removed when the tool is collected
+_tool_wrappers: dict[int, Callable[..., Any]] = {}
+
+
+def _make_tool_wrapper(tool: Tool) -> Callable[..., Any]:
+    """Create an async wrapper for a tool."""
+    # Weak so the cache doesn't keep the tool (and its finalizer) alive
+    tool_ref = weakref.ref(tool)
+    
+    async def wrapper(**kwargs):
+        return await tool_ref().execute(**kwargs)
+    wrapper.__name__ = tool.name
+    wrapper.__doc__ = tool.description
+    return wrapper
+
+
+@lru_cache(maxsize=512)
+def _compile_wrapped(code: str) -> CodeType:
+    """
+    Compile user code wrapped in an async function (to support await).
+    
+    Cached so repeated snippets (retries, evaluator loops) skip the parse.
+    """
+    # Add a pass statement in case the code is empty or has trailing newlines
+    indented = _indent(code.rstrip(), 4)
+    if not indented.strip():
+        indented = "    pass"
+    wrapped_code = f"async def __polytool_main__():\n{indented}\n    pass\n"
+    return compile(wrapped_code, "<sandbox>", "exec")
+
+
 def _indent(code: str, spaces: int) -> str:
     """Indent code by specified spaces."""
     prefix = " " * spaces
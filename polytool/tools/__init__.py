@@ -2,7 +2,7 @@
 
 from polytool.tools.decorator import tool
 from polytool.tools.registry import ToolRegistry, get_default_registry
-from polytool.tools.mcp import from_mcp, MCPConnection
+from polytool.tools.mcp import from_mcp, from_mcp_many, MCPConnection
 from polytool.tools.langchain import from_langchain, from_langchain_many
 
 __all__ = [
@@ -10,6 +10,7 @@ __all__ = [
     "ToolRegistry",
     "get_default_registry",
     "from_mcp",
+    "from_mcp_many",
     "MCPConnection",
     "from_langchain",
     "from_langchain_many",
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import glob as glob_module
-from pathlib import Path
-from typing import Annotated
+import os
+import re
+from fnmatch import translate
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path, PurePath
+from typing import Annotated, Callable
 
 from polytool.tools.decorator import tool
 
@@ -18,7 +24,7 @@ async def read_file(
     file_path = Path(path)
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {path}")
-    return file_path.read_text(encoding=encoding)
+    return await asyncio.to_thread(file_path.read_text, encoding=encoding)
 
 
 @tool
@@ -28,10 +34,13 @@ async def write_file(
     encoding: Annotated[str, "File encoding"] = "utf-8",
 ) -> str:
     """Write content to a file. Creates parent directories if needed."""
-    file_path = Path(path)
+    await asyncio.to_thread(_write, Path(path), content, encoding)
+    return f"Written {len(content)} bytes to {path}"
+
+
+def _write(file_path: Path, content: str, encoding: str) -> None:
     file_path.parent.mkdir(parents=True, exist_ok=True)
     file_path.write_text(content, encoding=encoding)
-    return f"Written {len(content)} bytes to {path}"
 
 
 @tool
@@ -50,36 +59,76 @@ async def list_dir(
     if not dir_path.is_dir():
         raise NotADirectoryError(f"Not a directory: {path}")
     
+    # scandir answers is_dir()/is_file() from the directory listing, so
+    # only regular files need a stat() call (for their size)
+    matches = _entry_matcher(pattern) if pattern else None
     entries = []
-    for entry in dir_path.iterdir():
-        if pattern and not entry.match(pattern):
-            continue
-        entries.append({
-            "name": entry.name,
-            "type": "directory" if entry.is_dir() else "file",
-            "size": entry.stat().st_size if entry.is_file() else 0,
-            "is_dir": entry.is_dir(),
-        })
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            if matches is not None and not matches(entry):
+                continue
+            is_dir = entry.is_dir()
+            entries.append({
+                "name": entry.name,
+                "type": "directory" if is_dir else "file",
+                "size": entry.stat().st_size if entry.is_file() else 0,
+                "is_dir": is_dir,
+            })
     
     return sorted(entries, key=lambda x: (not x["is_dir"], x["name"]))
 
 
+@lru_cache(maxsize=256)
+def _entry_matcher(pattern: str) -> Callable[[os.DirEntry[str]], bool]:
+    """Build the entry filter for a pattern once; the regex is compiled here."""
+    if "/" in pattern:
+        # Multi-part patterns match against the path's trailing components
+        return lambda entry: PurePath(entry.path).match(pattern)
+    match_name = re.compile(translate(pattern)).match
+    return lambda entry: match_name(entry.name) is not None
+
+
 @tool
 async def glob_files(
     pattern: Annotated[str, "Glob pattern (e.g., '**/*.py')"],
     root: Annotated[str, "Root directory to search from"] = ".",
+    limit: Annotated[int, "Maximum number of paths to return (0 for no limit)"] = 10000,
 ) -> list[str]:
     """
     Find files matching a glob pattern.
     
-    Supports recursive patterns with '**'.
+    Supports recursive patterns with '**'. Stops after 'limit' matches
+    (0 or less for no limit); the returned list's 'truncated' attribute
+    is then True and printing it says so.
     """
     root_path = Path(root)
     if not root_path.exists():
         raise FileNotFoundError(f"Root directory not found: {root}")
     
-    # Use glob
-    matches = list(root_path.glob(pattern))
-    return [str(m) for m in matches]
+    # The walk can be large; keep it off the event loop
+    return await asyncio.to_thread(_glob, root_path, pattern, limit)
+
+
+class _GlobResult(list):
+    """Paths from glob_files, flagged when the limit cut the listing short."""
+    
+    truncated = False
+    
+    def __repr__(self) -> str:
+        text = super().__repr__()
+        if self.truncated:
+            text += f" [truncated at {len(self)} matches; pass a higher limit for more]"
+        return text
+
+
+def _glob(root_path: Path, pattern: str, limit: int) -> list[str]:
+    # Path.glob is lazy, so stopping at the limit also stops the walk; one
+    # extra match tells a capped listing from a complete one
+    stop = limit + 1 if limit > 0 else None
+    result = _GlobResult(map(str, islice(root_path.glob(pattern), stop)))
+    if stop is not None and len(result) == stop:
+        result.pop()
+        result.truncated = True
+    return result
 
 
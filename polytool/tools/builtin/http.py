@@ -2,38 +2,64 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+import weakref
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from typing import Any, Annotated
 
 import httpx
 
+from polytool.core.serialization import loads
 from polytool.tools.decorator import tool
 
+# HTTP/2 needs the optional h2 package (httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# One pooled client per event loop; connections can't cross loops
+_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = weakref.WeakKeyDictionary()
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Shared client for the running loop, so keep-alive connections are reused."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = _clients[loop] = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=128),
+            http2=_HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(30.0),
+            # Calls share connections, not session state: store no cookies
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        )
+    return client
+
 
 @tool
 async def http_get(
     url: Annotated[str, "URL to fetch"],
     headers: Annotated[dict[str, str] | None, "Optional headers"] = None,
     timeout: Annotated[float, "Timeout in seconds"] = 30.0,
+    max_body_bytes: Annotated[int, "Stop reading the body after this many bytes (0 for no cap)"] = 0,
+    return_headers: Annotated[list[str] | None, "Response headers to include"] = None,
 ) -> dict[str, Any]:
     """
     Make an HTTP GET request.
     
-    Returns a dict with 'status_code', 'headers', and 'body'.
+    Returns a dict with 'status_code', 'headers', and 'body' (plus
+    'truncated': True if max_body_bytes cut the body short). 'headers'
+    only holds the names listed in return_headers; it is empty by default.
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers, timeout=timeout)
-        
-        # Try to parse JSON, fallback to text
-        try:
-            body = response.json()
-        except Exception:
-            body = response.text
-        
-        return {
-            "status_code": response.status_code,
-            "headers": dict(response.headers),
-            "body": body,
-        }
+    return await _request(
+        "GET",
+        url,
+        max_body_bytes,
+        return_headers,
+        headers=headers,
+        timeout=timeout,
+    )
 
 
 @tool
@@ -43,30 +69,81 @@ async def http_post(
     data: Annotated[dict[str, Any] | None, "Form data"] = None,
     headers: Annotated[dict[str, str] | None, "Optional headers"] = None,
     timeout: Annotated[float, "Timeout in seconds"] = 30.0,
+    max_body_bytes: Annotated[int, "Stop reading the body after this many bytes (0 for no cap)"] = 0,
+    return_headers: Annotated[list[str] | None, "Response headers to include"] = None,
 ) -> dict[str, Any]:
     """
     Make an HTTP POST request.
     
-    Returns a dict with 'status_code', 'headers', and 'body'.
+    Returns a dict with 'status_code', 'headers', and 'body' (plus
+    'truncated': True if max_body_bytes cut the body short). 'headers'
+    only holds the names listed in return_headers; it is empty by default.
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            url,
-            json=json,
-            data=data,
-            headers=headers,
-            timeout=timeout,
-        )
-        
-        try:
-            body = response.json()
-        except Exception:
-            body = response.text
-        
-        return {
-            "status_code": response.status_code,
-            "headers": dict(response.headers),
-            "body": body,
-        }
+    return await _request(
+        "POST",
+        url,
+        max_body_bytes,
+        return_headers,
+        json=json,
+        data=data,
+        headers=headers,
+        timeout=timeout,
+    )
+
+
+async def _request(
+    method: str,
+    url: str,
+    max_body_bytes: int,
+    return_headers: list[str] | None,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    async with _get_client().stream(method, url, **kwargs) as response:
+        content, truncated = await _read_body(response, max_body_bytes)
+    
+    result = {
+        "status_code": response.status_code,
+        "headers": _select_headers(response.headers, return_headers),
+        "body": _parse_body(response, content, truncated),
+    }
+    if truncated:
+        result["truncated"] = True
+    return result
+
+
+def _select_headers(headers: httpx.Headers, names: list[str] | str | None) -> dict[str, str | None]:
+    # Copying every header (cookies and all) is wasted work when callers
+    # want one or two of them
+    if not names:
+        return {}
+    if isinstance(names, str):
+        names = [names]
+    return {name: headers.get(name) for name in names}
 
 
+async def _read_body(response: httpx.Response, max_body_bytes: int) -> tuple[bytes, bool]:
+    if max_body_bytes <= 0:
+        return await response.aread(), False
+    
+    chunks: list[bytes] = []
+    size = 0
+    async for chunk in response.aiter_bytes():
+        room = max_body_bytes - size
+        if len(chunk) > room:
+            chunks.append(chunk[:room])
+            return b"".join(chunks), True
+        chunks.append(chunk)
+        size += len(chunk)
+    return b"".join(chunks), False
+
+
+def _parse_body(response: httpx.Response, content: bytes, truncated: bool) -> Any:
+    """JSON for JSON content types, text otherwise."""
+    # Only attempt a parse when the server says JSON (incl. +json types);
+    # a truncated body can't parse anyway
+    if not truncated and "json" in response.headers.get("content-type", ""):
+        try:
+            return loads(content)
+        except ValueError:
+            pass
+    return content.decode(response.encoding or "utf-8", errors="replace")
@@ -3,12 +3,24 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import re
 import shlex
+import signal
 from typing import Annotated
 
 from polytool.tools.decorator import tool
 from polytool.core.exceptions import ToolError
 
+# Output kept per stream; the rest is read and discarded so the child
+# never blocks on a full pipe
+_MAX_OUTPUT_BYTES = 8 * 1024 * 1024
+_READ_CHUNK = 64 * 1024
+
+# Anything that needs /bin/sh to interpret: pipes, redirection, expansion,
+# globbing, substitution, comments, assignments and line breaks
+_SHELL_META = re.compile(r"[|&;<>()$`*?\[\]{}~#!=\n]")
+
 
 @tool
 async def run_command(
@@ -24,20 +36,19 @@ async def run_command(
     WARNING: Be careful with user-provided commands.
     """
     try:
-        process = await asyncio.create_subprocess_shell(
-            command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=cwd,
-        )
+        process = await _spawn(command, cwd)
         
         try:
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
+            stdout, stderr, _ = await asyncio.wait_for(
+                asyncio.gather(
+                    _drain(process.stdout),
+                    _drain(process.stderr),
+                    process.wait(),
+                ),
                 timeout=timeout,
             )
         except asyncio.TimeoutError:
-            process.kill()
+            _kill(process)
             await process.wait()
             raise ToolError(
                 f"Command timed out after {timeout}s: {command}",
@@ -45,8 +56,8 @@ async def run_command(
             )
         
         return {
-            "stdout": stdout.decode("utf-8", errors="replace"),
-            "stderr": stderr.decode("utf-8", errors="replace"),
+            "stdout": stdout,
+            "stderr": stderr,
             "return_code": process.returncode or 0,
         }
     
@@ -59,3 +70,63 @@ async def run_command(
         ) from e
 
 
+async def _spawn(command: str, cwd: str | None) -> asyncio.subprocess.Process:
+    """
+    Start the command, skipping /bin/sh when it is a plain argv.
+    
+    Each command gets its own session so a timeout can kill everything
+    it started, not just the top-level process.
+    """
+    kwargs = {
+        "stdout": asyncio.subprocess.PIPE,
+        "stderr": asyncio.subprocess.PIPE,
+        "cwd": cwd,
+        "start_new_session": True,
+    }
+    if _SHELL_META.search(command) is None:
+        try:
+            argv = shlex.split(command)
+        except ValueError:
+            argv = None
+        if argv:
+            try:
+                return await asyncio.create_subprocess_exec(*argv, **kwargs)
+            except FileNotFoundError:
+                # Shell builtins (cd, export, ...) aren't on PATH
+                pass
+    return await asyncio.create_subprocess_shell(command, **kwargs)
+
+
+def _kill(process: asyncio.subprocess.Process) -> None:
+    """Kill the process and the rest of its process group."""
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (AttributeError, ProcessLookupError, PermissionError):
+        # No process groups on this platform, or the group is gone
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+
+
+async def _drain(stream: asyncio.StreamReader) -> str:
+    """Read a stream to EOF, keeping at most _MAX_OUTPUT_BYTES of it."""
+    chunks: list[bytes] = []
+    kept = 0
+    truncated = False
+    while True:
+        chunk = await stream.read(_READ_CHUNK)
+        if not chunk:
+            break
+        room = _MAX_OUTPUT_BYTES - kept
+        if len(chunk) > room:
+            chunk = chunk[:room]
+            truncated = True
+        if chunk:
+            chunks.append(chunk)
+            kept += len(chunk)
+    
+    text = b"".join(chunks).decode("utf-8", errors="replace")
+    if truncated:
+        text += f"\n[output truncated at {_MAX_OUTPUT_BYTES} bytes]"
+    return text
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import inspect
+import weakref
 from functools import wraps
-from typing import Any, Callable, TypeVar, get_type_hints, get_origin, get_args, Annotated
+from types import UnionType
+from typing import Any, Callable, TypeVar, Union, get_type_hints, get_origin, get_args, Annotated
 
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
@@ -44,8 +46,23 @@ def tool(func: F | None = None, *, name: str | None = None, description: str | N
     return decorator
 
 
+# Schemas per function, so re-decorating/normalizing skips the introspection
+_schema_cache: weakref.WeakKeyDictionary[Callable[..., Any], dict[str, Any]] = weakref.WeakKeyDictionary()
+
+
 def _generate_schema(func: Callable[..., Any]) -> dict[str, Any]:
-    """Generate JSON Schema from function signature."""
+    """Generate JSON Schema from function signature (cached; don't mutate it)."""
+    try:
+        return _schema_cache[func]
+    except KeyError:
+        schema = _schema_cache[func] = _build_schema(func)
+        return schema
+    except TypeError:
+        # Unhashable or not weak-referenceable (e.g. some callable objects)
+        return _build_schema(func)
+
+
+def _build_schema(func: Callable[..., Any]) -> dict[str, Any]:
     sig = inspect.signature(func)
     
     try:
@@ -98,26 +115,22 @@ def _type_to_schema(hint: Any, name: str = "") -> dict[str, Any]:
         args = get_args(hint)
         return _type_to_schema(args[0], name)
     
-    if hint is type(None):
-        return {"type": "null"}
+    if origin is Union or origin is UnionType:
+        args = [arg for arg in get_args(hint) if arg is not type(None)]
+        if len(args) == 1:
+            # X | None: the None default already shows in the signature
+            return _type_to_schema(args[0], name)
     
-    if hint is str:
-        return {"type": "string"}
-    elif hint is int:
-        return {"type": "integer"}
-    elif hint is float:
-        return {"type": "number"}
-    elif hint is bool:
-        return {"type": "boolean"}
-    elif hint is list or origin is list:
-        items_schema = {"type": "string"}
-        if origin is list:
-            args = get_args(hint)
-            if args:
-                items_schema = _type_to_schema(args[0])
-        return {"type": "array", "items": items_schema}
-    elif hint is dict or origin is dict:
-        return {"type": "object"}
+    if origin is None:
+        base = _PRIMITIVE_SCHEMAS.get(hint)
+        if base is not None:
+            # Copied: callers add "description" and "default" to the result
+            return base.copy()
+    
+    # Containers: bare (list) or parameterized (list[int])
+    handler = _CONTAINER_SCHEMAS.get(hint if origin is None else origin)
+    if handler is not None:
+        return handler(hint)
     
     if isinstance(hint, type) and issubclass(hint, BaseModel):
         return hint.model_json_schema()
@@ -125,6 +138,31 @@ def _type_to_schema(hint: Any, name: str = "") -> dict[str, Any]:
     return {"type": "string"}
 
 
+_PRIMITIVE_SCHEMAS: dict[Any, dict[str, Any]] = {
+    str: {"type": "string"},
+    int: {"type": "integer"},
+    float: {"type": "number"},
+    bool: {"type": "boolean"},
+    type(None): {"type": "null"},
+}
+
+
+def _list_schema(hint: Any) -> dict[str, Any]:
+    args = get_args(hint)
+    items_schema = _type_to_schema(args[0]) if args else {"type": "string"}
+    return {"type": "array", "items": items_schema}
+
+
+def _dict_schema(hint: Any) -> dict[str, Any]:
+    return {"type": "object"}
+
+
+_CONTAINER_SCHEMAS: dict[Any, Callable[[Any], dict[str, Any]]] = {
+    list: _list_schema,
+    dict: _dict_schema,
+}
+
+
 def get_tool_from_func(func: Callable[..., Any]) -> Tool | None:
     """Extract Tool from a decorated function."""
     if hasattr(func, "tool") and isinstance(func.tool, Tool):
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any
-
-from langchain_core.tools import BaseTool
+from typing import Any, TYPE_CHECKING
 
 from polytool.core.types import Tool, ToolSource
 from polytool.core.exceptions import ToolError
 
+if TYPE_CHECKING:
+    from langchain_core.tools import BaseTool
+
 
 def from_langchain(lc_tool: BaseTool) -> Tool:
     """Adapt a LangChain tool to PolyTool format."""
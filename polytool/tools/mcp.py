@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import Any
+from contextlib import AsyncExitStack
+from typing import Any, Awaitable, Callable
 
 from mcp.client.session import ClientSession
 from mcp.client.stdio import StdioServerParameters, stdio_client
@@ -11,6 +13,10 @@ from mcp.client.stdio import StdioServerParameters, stdio_client
 from polytool.core.types import Tool, ToolSource
 from polytool.core.exceptions import MCPError
 
+# Requests in flight per MCPConnection; the session matches responses to
+# requests by JSON-RPC id, so calls share the pipe without waiting in turn
+_MAX_IN_FLIGHT = 256
+
 
 async def from_mcp(
     command: list[str],
@@ -19,61 +25,30 @@ async def from_mcp(
     server_name: str | None = None,
     namespace: bool = True,
 ) -> list[Tool]:
-    """Import tools from an MCP server."""
-    if server_name is None:
-        for part in command:
-            if "server-" in part:
-                server_name = part.split("server-")[-1].split("/")[0]
-                break
-        if server_name is None:
-            server_name = command[0] if command else "mcp"
+    """
+    Import tools from an MCP server.
     
+    Each call of a returned tool starts the server again. To keep one
+    server process and session for many calls, use MCPConnection.
+    """
+    server_name = _resolve_server_name(command, server_name)
     full_env = {**os.environ, **(env or {})}
     
     try:
-        params = StdioServerParameters(command=command, env=full_env)
+        params = _server_params(command, full_env)
         
         async with stdio_client(params) as (read, write):
             async with ClientSession(read, write) as session:
                 await session.initialize()
                 tools_response = await session.list_tools()
-                
-                tools = []
-                for mcp_tool in tools_response.tools:
-                    tool_name = mcp_tool.name
-                    if namespace:
-                        tool_name = f"{server_name}.{mcp_tool.name}"
-                    
-                    tool = Tool(
-                        name=tool_name,
-                        description=mcp_tool.description or f"MCP tool: {mcp_tool.name}",
-                        parameters=mcp_tool.inputSchema or {"type": "object", "properties": {}},
-                        source=ToolSource.MCP,
-                    )
-                    
-                    original_name = mcp_tool.name
-                    
-                    async def make_executor(name: str, cmd: list[str], environment: dict):
-                        async def executor(**kwargs: Any) -> Any:
-                            async with stdio_client(
-                                StdioServerParameters(command=cmd, env=environment)
-                            ) as (r, w):
-                                async with ClientSession(r, w) as s:
-                                    await s.initialize()
-                                    result = await s.call_tool(name, kwargs)
-                                    if result.content:
-                                        for content in result.content:
-                                            if hasattr(content, "text"):
-                                                return content.text
-                                        return result.content
-                                    return None
-                        return executor
-                    
-                    executor = await make_executor(original_name, command, full_env)
-                    tool.set_executor(executor)
-                    tools.append(tool)
-                
-                return tools
+        
+        async def call_tool(name: str, arguments: dict[str, Any]) -> Any:
+            async with stdio_client(params) as (r, w):
+                async with ClientSession(r, w) as s:
+                    await s.initialize()
+                    return _unwrap_result(await s.call_tool(name, arguments))
+        
+        return _build_tools(tools_response.tools, server_name, namespace, call_tool)
     
     except Exception as e:
         if isinstance(e, MCPError):
@@ -81,14 +56,35 @@ async def from_mcp(
         raise MCPError(f"Failed to connect to MCP server: {e}", server=" ".join(command)) from e
 
 
+async def from_mcp_many(
+    servers: list[list[str]],
+    *,
+    env: dict[str, str] | None = None,
+    namespace: bool = True,
+) -> list[Tool]:
+    """Import tools from several MCP servers, connecting to them concurrently."""
+    results = await asyncio.gather(
+        *(from_mcp(command, env=env, namespace=namespace) for command in servers)
+    )
+    return [tool for tools in results for tool in tools]
+
+
 class MCPConnection:
-    """Persistent connection to an MCP server for better performance."""
+    """
+    Persistent connection to an MCP server for better performance.
+    
+    The server process and session are started once and shared by every
+    tool from get_tools(), so a call is a single JSON-RPC round trip.
+    Enter and exit the connection from the same task.
+    """
     
     def __init__(self, command: list[str], env: dict[str, str] | None = None, server_name: str | None = None):
         self.command = command
         self.env = {**os.environ, **(env or {})}
         self.server_name = server_name
         self._session: ClientSession | None = None
+        self._stack: AsyncExitStack | None = None
+        self._in_flight = asyncio.Semaphore(_MAX_IN_FLIGHT)
         self._tools: list[Tool] | None = None
     
     async def __aenter__(self) -> "MCPConnection":
@@ -99,13 +95,102 @@ class MCPConnection:
         await self.disconnect()
     
     async def connect(self) -> None:
-        pass
+        if self._session is not None:
+            return
+        
+        stack = AsyncExitStack()
+        try:
+            read, write = await stack.enter_async_context(
+                stdio_client(_server_params(self.command, self.env))
+            )
+            session = await stack.enter_async_context(ClientSession(read, write))
+            await session.initialize()
+        except Exception as e:
+            await stack.aclose()
+            raise MCPError(
+                f"Failed to connect to MCP server: {e}", server=" ".join(self.command)
+            ) from e
+        
+        self._stack = stack
+        self._session = session
     
     async def disconnect(self) -> None:
+        stack = self._stack
+        self._stack = None
         self._session = None
         self._tools = None
+        if stack is not None:
+            await stack.aclose()
     
     async def get_tools(self) -> list[Tool]:
         if self._tools is None:
-            self._tools = await from_mcp(self.command, env=self.env, server_name=self.server_name)
+            await self.connect()
+            tools_response = await self._session.list_tools()
+            self._tools = _build_tools(
+                tools_response.tools,
+                _resolve_server_name(self.command, self.server_name),
+                True,
+                self._call_tool,
+            )
         return self._tools
+    
+    async def _call_tool(self, name: str, arguments: dict[str, Any]) -> Any:
+        session = self._session
+        if session is None:
+            raise MCPError("MCP connection is closed", server=" ".join(self.command))
+        async with self._in_flight:
+            result = await session.call_tool(name, arguments)
+        return _unwrap_result(result)
+
+
+def _resolve_server_name(command: list[str], server_name: str | None) -> str:
+    if server_name is not None:
+        return server_name
+    for part in command:
+        if "server-" in part:
+            return part.split("server-")[-1].split("/")[0]
+    return command[0] if command else "mcp"
+
+
+def _server_params(command: list[str], env: dict[str, str]) -> StdioServerParameters:
+    return StdioServerParameters(command=command[0], args=command[1:], env=env)
+
+
+def _build_tools(
+    mcp_tools: list[Any],
+    server_name: str,
+    namespace: bool,
+    call_tool: Callable[[str, dict[str, Any]], Awaitable[Any]],
+) -> list[Tool]:
+    tools = []
+    for mcp_tool in mcp_tools:
+        tool_name = mcp_tool.name
+        if namespace:
+            tool_name = f"{server_name}.{mcp_tool.name}"
+        
+        tool = Tool(
+            name=tool_name,
+            description=mcp_tool.description or f"MCP tool: {mcp_tool.name}",
+            parameters=mcp_tool.inputSchema or {"type": "object", "properties": {}},
+            source=ToolSource.MCP,
+        )
+        tool.set_executor(_make_executor(mcp_tool.name, call_tool))
+        tools.append(tool)
+    return tools
+
+
+def _make_executor(
+    name: str, call_tool: Callable[[str, dict[str, Any]], Awaitable[Any]]
+) -> Callable[..., Awaitable[Any]]:
+    async def executor(**kwargs: Any) -> Any:
+        return await call_tool(name, kwargs)
+    return executor
+
+
+def _unwrap_result(result: Any) -> Any:
+    if result.content:
+        for content in result.content:
+            if hasattr(content, "text"):
+                return content.text
+        return result.content
+    return None
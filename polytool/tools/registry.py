@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import inspect
+import sys
 from typing import Any, Callable
 
-from polytool.core.types import Tool, ToolSource
+from polytool.core.types import Tool, ToolSource, tool_edit_count
 from polytool.core.exceptions import ToolError
 from polytool.tools.decorator import get_tool_from_func
 
@@ -19,6 +22,13 @@ class ToolRegistry:
     
     def __init__(self) -> None:
         self._tools: dict[str, Tool] = {}
+        self._by_source: dict[ToolSource, dict[str, Tool]] = {}
+        self._callables: dict[str, Callable[..., Any]] = {}
+        self._version = 0
+        # Derived views, rebuilt lazily once version moves past _views_version
+        self._views_version = -1
+        self._llm_schemas: list[dict[str, Any]] | None = None
+        self._signatures: str | None = None
     
     def register(self, tool_or_func: Tool | Callable[..., Any]) -> Tool:
         """
@@ -33,30 +43,62 @@ class ToolRegistry:
         Raises:
             ToolError: If tool name already exists or invalid input
         """
-        if isinstance(tool_or_func, Tool):
-            tool = tool_or_func
-        elif callable(tool_or_func):
-            tool = get_tool_from_func(tool_or_func)
-            if tool is None:
-                raise ToolError(
-                    f"Function {tool_or_func.__name__} is not decorated with @tool",
-                    tool_name=getattr(tool_or_func, "__name__", None),
-                )
-        else:
-            raise ToolError(f"Cannot register {type(tool_or_func)}")
-        
+        tool = _resolve_tool(tool_or_func)
         if tool.name in self._tools:
             raise ToolError(
                 f"Tool '{tool.name}' already registered",
                 tool_name=tool.name,
             )
         
-        self._tools[tool.name] = tool
+        self._insert(tool)
+        self._changed()
         return tool
     
     def register_many(self, tools: list[Tool | Callable[..., Any]]) -> list[Tool]:
-        """Register multiple tools at once."""
-        return [self.register(t) for t in tools]
+        """
+        Register multiple tools at once.
+        
+        All names are checked before anything is added, so on a duplicate
+        the registry is left unchanged.
+        
+        Raises:
+            ToolError: If a tool name already exists or repeats in tools
+        """
+        resolved = [_resolve_tool(t) for t in tools]
+        
+        seen = set(self._tools)
+        for tool in resolved:
+            if tool.name in seen:
+                raise ToolError(
+                    f"Tool '{tool.name}' already registered",
+                    tool_name=tool.name,
+                )
+            seen.add(tool.name)
+        
+        for tool in resolved:
+            self._insert(tool)
+        if resolved:
+            self._changed()
+        return resolved
+    
+    async def register_many_async(self, tools: list[Any]) -> list[Tool]:
+        """
+        Register tools, resolving any awaitables among them concurrently.
+        
+        Awaitables (e.g. from_mcp(...) coroutines) may produce a Tool or a
+        list of Tools, so several MCP servers start up in parallel.
+        """
+        pending = [t for t in tools if inspect.isawaitable(t)]
+        results = iter(await asyncio.gather(*pending))
+        
+        resolved: list[Tool | Callable[..., Any]] = []
+        for t in tools:
+            item = next(results) if inspect.isawaitable(t) else t
+            if isinstance(item, list):
+                resolved.extend(item)
+            else:
+                resolved.append(item)
+        return self.register_many(resolved)
     
     def get(self, name: str) -> Tool:
         """
@@ -65,13 +107,13 @@ class ToolRegistry:
         Raises:
             ToolError: If tool not found
         """
-        if name not in self._tools:
-            available = ", ".join(self._tools.keys())
+        tool = self._tools.get(name)
+        if tool is None:
             raise ToolError(
-                f"Tool '{name}' not found. Available: {available}",
+                f"Tool '{name}' not found. Available: {', '.join(self._tools)}",
                 tool_name=name,
             )
-        return self._tools[name]
+        return tool
     
     def get_all(self) -> list[Tool]:
         """Get all registered tools."""
@@ -79,7 +121,7 @@ class ToolRegistry:
     
     def get_by_source(self, source: ToolSource) -> list[Tool]:
         """Get tools from a specific source."""
-        return [t for t in self._tools.values() if t.source == source]
+        return list(self._by_source.get(source, {}).values())
     
     def has(self, name: str) -> bool:
         """Check if a tool is registered."""
@@ -87,12 +129,51 @@ class ToolRegistry:
     
     def remove(self, name: str) -> None:
         """Remove a tool from the registry."""
-        if name in self._tools:
-            del self._tools[name]
+        tool = self._tools.pop(name, None)
+        if tool is not None:
+            self._by_source.get(tool.source, {}).pop(name, None)
+            self._callables.pop(name, None)
+            self._changed()
     
     def clear(self) -> None:
         """Remove all tools."""
         self._tools.clear()
+        self._by_source.clear()
+        self._callables.clear()
+        self._changed()
+    
+    def _insert(self, tool: Tool) -> None:
+        # Build the per-tool views now rather than on the first LLM turn
+        tool.to_openai_schema()
+        tool.get_signature()
+        tool.get_summary()
+        
+        # Interned so lookups with the same literal hit the identity fast path
+        name = sys.intern(tool.name)
+        self._tools[name] = tool
+        self._by_source.setdefault(tool.source, {})[name] = tool
+    
+    def _changed(self) -> None:
+        """Bump the version after a change."""
+        self._version += 1
+    
+    def _check_views(self) -> None:
+        """Drop derived views built before a change or a tool edit."""
+        version = self.version
+        if self._views_version != version:
+            self._views_version = version
+            self._llm_schemas = None
+            self._signatures = None
+    
+    @property
+    def version(self) -> int:
+        """
+        Counter bumped on every change, for callers caching derived data.
+        
+        Also moves when any Tool's name, description or parameters are
+        edited, since that changes what the registry renders.
+        """
+        return self._version + tool_edit_count()
     
     def __len__(self) -> int:
         return len(self._tools)
@@ -114,8 +195,19 @@ class ToolRegistry:
         Returns:
             Tool execution result
         """
-        tool = self.get(name)
-        return await tool.execute(**kwargs)
+        return await self.get_callable(name)(**kwargs)
+    
+    def get_callable(self, name: str) -> Callable[..., Any]:
+        """
+        Get a tool's bound execute coroutine function, cached per name.
+        
+        Raises:
+            ToolError: If tool not found
+        """
+        fn = self._callables.get(name)
+        if fn is None:
+            fn = self._callables[name] = self.get(name).execute
+        return fn
     
     def get_for_llm(self) -> list[dict[str, Any]]:
         """
@@ -124,7 +216,10 @@ class ToolRegistry:
         Returns:
             List of tool schemas for LLM
         """
-        return [tool.to_openai_schema() for tool in self._tools.values()]
+        self._check_views()
+        if self._llm_schemas is None:
+            self._llm_schemas = [tool.to_openai_schema() for tool in self._tools.values()]
+        return list(self._llm_schemas)
     
     def get_signatures(self) -> str:
         """
@@ -132,18 +227,35 @@ class ToolRegistry:
         
         Used in system prompts for execute_code.
         """
-        lines = []
-        for tool in self._tools.values():
-            sig = tool.get_signature()
-            desc = tool.description.split("\n")[0]  # First line only
-            lines.append(f"{sig}\n    '''{desc}'''")
-        return "\n\n".join(lines)
+        self._check_views()
+        if self._signatures is None:
+            lines = []
+            for tool in self._tools.values():
+                sig = tool.get_signature()
+                lines.append(f"{sig}\n    '''{tool.get_summary()}'''")
+            self._signatures = "\n\n".join(lines)
+        return self._signatures
     
     def get_names(self) -> list[str]:
         """Get list of all tool names."""
         return list(self._tools.keys())
 
 
+def _resolve_tool(tool_or_func: Tool | Callable[..., Any]) -> Tool:
+    """Get the Tool for a Tool object or @tool decorated function."""
+    if isinstance(tool_or_func, Tool):
+        return tool_or_func
+    if callable(tool_or_func):
+        tool = get_tool_from_func(tool_or_func)
+        if tool is None:
+            raise ToolError(
+                f"Function {tool_or_func.__name__} is not decorated with @tool",
+                tool_name=getattr(tool_or_func, "__name__", None),
+            )
+        return tool
+    raise ToolError(f"Cannot register {type(tool_or_func)}")
+
+
 # Global default registry
 _default_registry: ToolRegistry | None = None
 
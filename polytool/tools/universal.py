@@ -3,10 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+import sys
 from typing import Any, Callable
 
-from langchain_core.tools import BaseTool as LangChainBaseTool
-
 from polytool.core.types import Tool, ToolSource
 from polytool.tools.decorator import get_tool_from_func, _generate_schema
 
@@ -21,7 +20,7 @@ def normalize_tool(tool_input: Any, *, name: str | None = None, description: str
         if tool:
             return tool
     
-    if isinstance(tool_input, LangChainBaseTool):
+    if _is_langchain_tool(tool_input):
         return _normalize_langchain_tool(tool_input)
     
     if callable(tool_input):
@@ -35,6 +34,13 @@ def normalize_tools(tools: list[Any]) -> list[Tool]:
     return [normalize_tool(t) for t in tools]
 
 
+def _is_langchain_tool(obj: Any) -> bool:
+    """Check for a LangChain BaseTool without importing LangChain."""
+    # If langchain_core.tools was never imported, obj can't be one of its tools
+    lc_tools = sys.modules.get("langchain_core.tools")
+    return lc_tools is not None and isinstance(obj, lc_tools.BaseTool)
+
+
 def _normalize_langchain_tool(lc_tool: Any) -> Tool:
     """Convert LangChain BaseTool to PolyTool Tool."""
     parameters: dict[str, Any] = {"type": "object", "properties": {}}